@@ -1,9 +1,20 @@
+import time
+
+# Début du rendu de cette session (voir record_first_render en fin de script)
+render_start = time.perf_counter()
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from utils.data_processing import *
-import os
+from utils.data_processing import (
+    get_kpi_metrics,
+    get_sales_by_store,
+    get_sales_by_category,
+    get_payment_distribution,
+    get_satisfaction_by_store,
+    get_satisfaction_by_category,
+    get_daily_sales
+)
+from utils.warmup import DEFAULT_DATA_PATH, get_dataset, get_plotly_express, record_first_render
 
 # Configuration de la page
 st.set_page_config(
@@ -54,18 +65,11 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
-# Chargement des données avec cache
-@st.cache_data
-def load_data():
-    file_path = 'data/data_dashboard_large.xlsx'
-    if os.path.exists(file_path):
-        return load_and_clean_data(file_path)
-    else:
-        st.error(f"❌ Fichier non trouvé : {file_path}")
-        return None
+# Charger les données (mises en cache par processus, voir utils/warmup.py)
+df, filter_index, load_error = get_dataset(DEFAULT_DATA_PATH)
 
-# Charger les données
-df = load_data()
+if load_error is not None:
+    st.error(f"❌ {load_error}")
 
 if df is not None:
     # Titre principal
@@ -79,24 +83,24 @@ if df is not None:
     st.sidebar.markdown("---")
     
     # Filtre par magasin
-    magasins = ['Tous'] + sorted(df['Magasin'].unique().tolist())
+    magasins = ['Tous'] + filter_index['magasins']
     selected_magasin = st.sidebar.selectbox("🏪 Sélectionner un Magasin", magasins)
     
     # Filtre par catégorie
-    categories = ['Toutes'] + sorted(df['Categorie_Produit'].unique().tolist())
+    categories = ['Toutes'] + filter_index['categories']
     selected_categorie = st.sidebar.selectbox("📦 Sélectionner une Catégorie", categories)
     
     # Filtre par mode de paiement
     if 'Mode_Paiement' in df.columns:
-        modes_paiement = ['Tous'] + sorted(df['Mode_Paiement'].unique().tolist())
+        modes_paiement = ['Tous'] + filter_index['modes_paiement']
         selected_mode = st.sidebar.selectbox("💳 Mode de Paiement", modes_paiement)
     else:
         selected_mode = 'Tous'
     
     # Filtre par date
     if 'Date_Transaction' in df.columns:
-        date_min = df['Date_Transaction'].min().date()
-        date_max = df['Date_Transaction'].max().date()
+        date_min = filter_index['date_min']
+        date_max = filter_index['date_max']
         date_range = st.sidebar.date_input(
             "📅 Période",
             value=(date_min, date_max),
@@ -175,6 +179,11 @@ if df is not None:
         
         st.markdown("---")
         
+        # Import de plotly juste avant le premier graphique : les KPIs sont déjà
+        # affichés. Sous serve.py le warm-up l'a déjà fait, sinon la première
+        # session paie l'import ici.
+        px = get_plotly_express()
+        
         # Graphique des ventes quotidiennes
         st.subheader("📈 Évolution des Ventes Quotidiennes")
         
@@ -535,6 +544,9 @@ if df is not None:
         "<p style='text-align: center; color: #A0A0A0;'>Dashboard créé avec Streamlit & Plotly  de python et réalisé par l'élève professeur EKOTTO ERIC| © 2025</p>",
         unsafe_allow_html=True
     )
+    
+    # Mesure du temps de rendu de la première session (journalisé côté serveur)
+    record_first_render(render_start)
 
 else:
     st.error("❌ Impossible de charger les données. Vérifiez que le fichier 'data/data_dashboard_large.xlsx' existe.")
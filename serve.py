@@ -0,0 +1,37 @@
+"""
+Lance le dashboard avec un warm-up au démarrage du processus.
+
+    python serve.py [options streamlit run, ex. --server.port 8080]
+
+Le serveur n'ouvre son port qu'après un warm-up réussi : le health check de
+Streamlit (/_stcore/health) ne répond donc qu'une fois les données en mémoire.
+Si le warm-up échoue, le processus s'arrête avec le code 1.
+
+Les options sont celles de `streamlit run` (ligne de commande, variables
+STREAMLIT_* ou .streamlit/config.toml).
+"""
+import time
+
+PROCESS_START = time.perf_counter()
+
+import os
+import sys
+
+from utils import warmup
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+
+def main(args):
+    os.chdir(os.path.dirname(APP_PATH))
+    if not warmup.warmup(process_start=PROCESS_START):
+        print("Arrêt : le serveur ne démarre pas sans données")
+        sys.exit(1)
+
+    # Même traitement des options que `streamlit run` (flags et STREAMLIT_*)
+    from streamlit.web import cli
+    cli.main(args=['run', APP_PATH] + args, prog_name='streamlit')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
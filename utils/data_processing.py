@@ -116,4 +116,22 @@ def get_daily_sales(df):
         daily_sales = df.groupby('Jour')['Montant'].sum().reset_index()
         daily_sales.columns = ['Date', 'Ventes']
         return daily_sales
-    return None
\ No newline at end of file
+    return None
+
+def build_filter_index(df):
+    """
+    Pré-calcule les valeurs des filtres (listes triées et bornes de dates)
+    """
+    index = {
+        'magasins': sorted(df['Magasin'].unique().tolist()),
+        'categories': sorted(df['Categorie_Produit'].unique().tolist()),
+        'modes_paiement': None,
+        'date_min': None,
+        'date_max': None
+    }
+    if 'Mode_Paiement' in df.columns:
+        index['modes_paiement'] = sorted(df['Mode_Paiement'].unique().tolist())
+    if 'Date_Transaction' in df.columns:
+        index['date_min'] = df['Date_Transaction'].min().date()
+        index['date_max'] = df['Date_Transaction'].max().date()
+    return index
@@ -0,0 +1,102 @@
+"""
+Démarrage à froid : cache des données par processus et warm-up.
+
+Les données nettoyées et l'index des filtres sont gardés au niveau du module,
+partagés par toutes les sessions du processus. st.cache_data ne convient pas
+ici : il ne peut pas être rempli avant que le runtime Streamlit existe, alors
+que serve.py lance le warm-up avant de démarrer le serveur.
+
+Seul un chargement réussi est conservé, pour toute la durée du processus : un
+échec (fichier absent ou verrouillé par Excel) est retenté au rerun suivant,
+mais une mise à jour du fichier Excel demande un redémarrage.
+"""
+import os
+import threading
+import time
+
+# Démarrage du processus (approximatif : import de ce module)
+PROCESS_START = time.perf_counter()
+
+DEFAULT_DATA_PATH = 'data/data_dashboard_large.xlsx'
+
+_lock = threading.Lock()
+_dataset = {}
+_process_start = PROCESS_START
+_first_render_logged = False
+
+
+def get_plotly_express():
+    """
+    Importe plotly.express à la demande (import coûteux au démarrage)
+    """
+    import plotly.express as px
+    return px
+
+
+def get_dataset(file_path=DEFAULT_DATA_PATH):
+    """
+    Retourne (df, index des filtres, erreur), chargés une seule fois par processus
+    """
+    with _lock:
+        if file_path in _dataset:
+            return _dataset[file_path]
+        result = _load_dataset(file_path)
+        if result[2] is None:
+            _dataset[file_path] = result
+        return result
+
+
+def _load_dataset(file_path):
+    from utils.data_processing import load_and_clean_data, build_filter_index
+
+    if not os.path.exists(file_path):
+        return None, None, f"Fichier non trouvé : {file_path}"
+
+    start = time.perf_counter()
+    df = load_and_clean_data(file_path)
+    load_time = time.perf_counter() - start
+    if df is None:
+        return None, None, f"Erreur lors du chargement de : {file_path}"
+
+    start = time.perf_counter()
+    index = build_filter_index(df)
+    index_time = time.perf_counter() - start
+
+    print(f"Données chargées en {load_time:.2f} s, index construit en {index_time:.2f} s")
+    return df, index, None
+
+
+def warmup(file_path=DEFAULT_DATA_PATH, process_start=PROCESS_START):
+    """
+    Pré-charge les imports lourds, les données et les index avant le trafic
+    """
+    global _process_start
+    _process_start = process_start
+    get_plotly_express()
+    df, _, error = get_dataset(file_path)
+
+    elapsed = time.perf_counter() - process_start
+    if error is None:
+        print(f"Warm-up terminé {elapsed:.2f} s après le démarrage du processus")
+    else:
+        print(f"Warm-up échoué après {elapsed:.2f} s : {error}")
+    return error is None
+
+
+def record_first_render(render_start):
+    """
+    Journalise le premier rendu complet du processus (une seule fois) :
+    durée du script et temps écoulé depuis le démarrage du processus
+    """
+    global _first_render_logged
+    now = time.perf_counter()
+    elapsed = now - render_start
+    with _lock:
+        if not _first_render_logged:
+            _first_render_logged = True
+            print(
+                f"Premier rendu : script exécuté en {elapsed:.2f} s, "
+                f"{now - _process_start:.2f} s après le démarrage du processus "
+                f"(attente du premier visiteur incluse)"
+            )
+    return elapsed